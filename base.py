@@ -7,6 +7,8 @@ import abc
 import sys
 import json
 import types
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 from typing import TypeVar, Any, Callable, Union, ClassVar, TYPE_CHECKING, get_origin, get_args
 
@@ -25,6 +27,33 @@ def iopen(path, mode="r", **kwargs):
         return open(os.path.join(dirname, files[name]), mode, **kwargs)  # pylint: disable=unspecified-encoding
     raise FileNotFoundError(path)
 
+_PARSE_CACHE_SIZE = 64
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_xml(path: str, _mtime: int) -> ET.Element:
+    """Parses an XML file, sharing the result between every load that references it while it's unchanged.
+    The returned element must not be modified"""
+    return ET.parse(path).getroot()
+
+def _source_path(referrer: str, source: str) -> str:
+    """Resolves the source of an external resource against the path of the file that references it"""
+    return os.path.join(os.path.dirname(referrer), source)
+
+def _prefetch_xml(paths: list[str]) -> None:
+    """Reads and parses several XML files concurrently, so that the loader's later _parse_xml calls are cache
+    hits. Files that are missing or fail to parse are skipped here, and reported by the loader when it gets to them"""
+    jobs = []
+    for path in dict.fromkeys(paths):
+        try:
+            jobs.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    if len(jobs) < 2:
+        return
+    with ThreadPoolExecutor(min(len(jobs), 8)) as pool:
+        for future in [pool.submit(_parse_xml, *job) for job in jobs[:_PARSE_CACHE_SIZE]]:
+            future.exception()
+
 def not_optional(x: T | None) -> T:
     assert x is not None, "must not be None"
     return x
@@ -66,14 +95,12 @@ class SpecializableMixin(_SpecializableMixinBase):
 
     @classmethod
     def _load(cls, data: ET.Element | dict, parent: Entry | None, ctx: LoaderContext) -> Entry:
-        if cls is not cls.OBJECT_BASE:
-            return super(SpecializableMixin, cls)._load(data, parent, ctx)  # pylint: disable=no-member
-
-        stype = data.attrib.get(not_optional(cls.ATTRIB)) if isinstance(data, ET.Element) else data.get(not_optional(cls.ATTRIB))
-        if stype is None or stype not in cls.OBJECT_TYPES:
-            return super(SpecializableMixin, cls)._load(data, parent, ctx)  # pylint: disable=no-member
-
-        return cls.OBJECT_TYPES[stype]._load(data, parent, ctx)  # pylint: disable=protected-access
+        if cls is cls.OBJECT_BASE:
+            attrib = data.attrib if isinstance(data, ET.Element) else data
+            specialized = cls.OBJECT_TYPES.get(attrib.get(not_optional(cls.ATTRIB)))
+            if specialized is not None:
+                return specialized._load(data, parent, ctx)  # pylint: disable=protected-access
+        return super(SpecializableMixin, cls)._load(data, parent, ctx)  # pylint: disable=no-member
 
 class BaseLoader:
     """The base loader class. If you want to use your own data classes, you'll need to inherit from
@@ -89,6 +116,10 @@ class BaseLoader:
 
         if path.lower().endswith((".tmx", ".xml")):
             data = ET.parse(path).getroot()
+            # external tilesets are read in parallel up front, as loading them one by one is IO-bound
+            sources = [_source_path(path, i.attrib["source"]) for i in data if "source" in i.attrib]
+            if len(sources) > 1:
+                _prefetch_xml(sources)
         else:
             with iopen(path, "r", encoding="utf-8") as f:
                 data = json.loads(f.read())
@@ -123,14 +154,32 @@ class BaseLoader:
             cls.PARSERS = {}
         cls.STRICT = strict
 
+def _load_bool(data: Any) -> bool:
+    return (isinstance(data, bool) and data) or (isinstance(data, str) and data.lower() != "false")
+
+def _converter_for(tp: type[Any]) -> Callable[[Any], Any] | None:
+    """Returns the function that turns a raw JSON or XML value into an instance of the given
+    non-Entry type, or None if the type is an Entry (and has to be loaded through LoaderContext.load)"""
+    if issubclass(tp, Entry):
+        return None
+    if issubclass(tp, (int, float, str)):
+        return tp
+    if issubclass(tp, bool):
+        return _load_bool
+    raise TypeError(f"can't load {tp}")
+
 class LoaderContext:
     """Context for a currently ongoing load"""
 
     def __init__(self, loader, path):
         self.path = path
+        self.root_dir = os.path.dirname(path)
         self.loader = loader
         self.loaded_entries_memo = []
         self.entry_data_map = {}
+        self.xml_child_routes: dict[type[Entry], dict[str, list[tuple[str, type[Entry]]]]] = {}
+        self.xml_children: tuple[ET.Element, type[Entry], dict[str, list[tuple[type[Entry], ET.Element]]]] | None = None
+        self.json_types: dict[ParsedField, dict[Any, list[type[Entry]]]] = {}
 
     def load(self, cls: type[Any] | None, data: T, parent: Entry | None):
         """Loads a JSON or XML datum, attempting to turn it into an instance of the given
@@ -138,30 +187,65 @@ class LoaderContext:
         if cls is None:
             if not isinstance(data, ET.Element):
                 raise ValueError("cannot guess class for JSON object")
-            cls = self.loader.LOADERS[data.tag]
+            cls = self.loader.PARSERS[data.tag]
 
         if issubclass(cls, Entry):
             obj = cls._load(data, parent, self)  # pylint: disable=protected-access
-            self.loaded_entries_memo.append(obj)
+            if type(obj).post_load is not Entry.post_load:  # most classes don't override it, don't queue those
+                self.loaded_entries_memo.append(obj)
             self.entry_data_map[id(obj)] = data
             return obj
-        elif issubclass(cls, (int, float, str)):
-            return cls(data)
-        elif issubclass(cls, bool):
-            return (isinstance(data, bool) and data) or (isinstance(data, str) and data.lower() != "false")
-        else:
-            raise TypeError(f"can't load {cls}")
+        return not_optional(_converter_for(cls))(data)
+
+    def group_xml_children(self, cls: type[Entry], element: ET.Element) -> dict[str, list[tuple[type[Entry], ET.Element]]]:
+        """Splits the children of an XML element between the xml_child fields of the given Entry class
+        in a single pass, keeping document order, and pairs each child with the class it's loaded as.
+        The result is kept around for that element's other fields"""
+        if self.xml_children is not None and self.xml_children[0] is element and self.xml_children[1] is cls:
+            return self.xml_children[2]
+
+        routes = self.xml_child_routes.get(cls)
+        if routes is None:
+            routes = self.xml_child_routes[cls] = {}
+            for field in cls.FIELDS.values():
+                if isinstance(field, ParsedField) and field.xml_child:
+                    for tag, parser in field.tag_parsers(self.loader.PARSERS).items():
+                        routes.setdefault(tag, []).append((field.dst_name, parser))
+
+        groups: dict[str, list[tuple[type[Entry], ET.Element]]] = {}
+        for elem in element:
+            for name, parser in routes.get(elem.tag, ()):
+                groups.setdefault(name, []).append((parser, elem))
+        self.xml_children = element, cls, groups
+        return groups
+
+    def json_types_of(self, field: ParsedField) -> dict[Any, list[type[Entry]]]:
+        """Groups the parsers a field's values can be loaded with by their JSON type"""
+        types_ = self.json_types.get(field)
+        if types_ is None:
+            types_ = self.json_types[field] = {}
+            for parser in field.tag_parsers(self.loader.PARSERS).values():
+                types_.setdefault(parser.JSON_TYPE, []).append(parser)
+        return types_
 
     def copy(self, path=None, loader=None, loaded_entries_memo=None):
         """Copies this LoaderContext, optionally with modified properties"""
         ctx = LoaderContext(loader or self.loader, path or self.path)
+        ctx.root_dir = self.root_dir
         ctx.loaded_entries_memo = loaded_entries_memo or self.loaded_entries_memo[:]
         ctx.entry_data_map = self.entry_data_map.copy()
+        if loader is None:
+            ctx.xml_child_routes = self.xml_child_routes
+            ctx.json_types = self.json_types
         return ctx
 
+_UNRESOLVED: Any = object()
+
 class Field:
     """Information about a field of an Entry"""
 
+    __slots__ = ("_type_info", "dst_name", "owner", "default")
+
     _type_info: tuple[type, bool, bool]
     dst_name: str
     owner: type[Entry]
@@ -202,6 +286,8 @@ class Field:
         raise ValueError(f"missing attribute {self.dst_name} on {instance.__class__.__qualname__}")
 
 class CustomLoaderField(Field):
+    __slots__ = "loader",
+
     loader: Callable[[Entry, T, Entry | None, LoaderContext], U]
 
     def __init__(self, loader, **kwargs):
@@ -212,6 +298,8 @@ class CustomLoaderField(Field):
         return self.loader(instance, instance_data, parent, ctx)
 
 class AliasField(Field):
+    __slots__ = "to",
+
     to: str
 
     def __init__(self, to, **kwargs):
@@ -228,6 +316,8 @@ class AliasField(Field):
             return value
 
 class ParsedField(Field):
+    __slots__ = ("_converter", "xml_child", "xml_text", "xml_rename_from", "json_rename_from")
+
     xml_child: bool
     xml_text: bool
 
@@ -236,6 +326,7 @@ class ParsedField(Field):
 
     def __init__(self, *, xml_child=False, xml_text=False, xml_rename_from=None, json_rename_from=None, rename_from=None, **kwargs):
         super().__init__(**kwargs)
+        self._converter = _UNRESOLVED
         self.xml_child = xml_child
         self.xml_text = xml_text
         self.xml_rename_from = self.json_rename_from = rename_from
@@ -244,20 +335,26 @@ class ParsedField(Field):
         if json_rename_from is not None:
             self.json_rename_from = json_rename_from
 
+    @property
+    def converter(self) -> Callable[[Any], Any] | None:
+        """The _converter_for this field's type, resolved once"""
+        if self._converter is _UNRESOLVED:
+            self._converter = _converter_for(self.type_info[0])
+        return self._converter
+
+    def tag_parsers(self, parsers: dict[str, type[Entry]]) -> dict[str, type[Entry]]:
+        """The subset of the given parsers (keyed by tag) that this field's values can be loaded with"""
+        loader_class = self.type_info[0]
+        return {k: v for k, v in parsers.items() if issubclass(v, loader_class)}
+
     def load(self, instance: Entry, instance_data: ET.Element | dict, parent: Entry | None, ctx: LoaderContext) -> Any:  # 50 loc
         loader_class, is_array, _ = self.type_info
 
-        all_tags_xml = {}
-        all_tags_json: dict[str, list[type[Entry]]] = {}
-        for k, v in ctx.loader.PARSERS.items():
-            if issubclass(v, loader_class):
-                all_tags_xml[k] = v
-                all_tags_json.setdefault(v.JSON_TYPE, []).append(v)
-
         if isinstance(instance_data, ET.Element):
             src_name = self.dst_name or self.xml_rename_from
             if self.xml_child:
-                element_data = [ctx.load(all_tags_xml[elem.tag], elem, instance) for elem in instance_data if elem.tag in all_tags_xml]
+                children = ctx.group_xml_children(type(instance), instance_data).get(self.dst_name, ())
+                element_data = [ctx.load(parser, elem, instance) for parser, elem in children]
                 if is_array:
                     return element_data
                 if len(element_data) > 1:
@@ -266,6 +363,9 @@ class ParsedField(Field):
             if self.xml_text:
                 return instance_data.text
             if src_name in instance_data.attrib:
+                convert = self.converter
+                if convert is not None:
+                    return convert(instance_data.attrib[src_name])
                 return ctx.load(loader_class, instance_data.attrib[src_name], instance)
             return super().load(instance, instance_data, parent, ctx)
 
@@ -273,7 +373,11 @@ class ParsedField(Field):
         if src_name not in instance_data:
             return super().load(instance, instance_data, parent, ctx)
         child_data = instance_data[src_name]
+        convert = self.converter
+        if convert is not None:
+            return [convert(i) for i in child_data] if is_array else convert(child_data)
 
+        all_tags_json = ctx.json_types_of(self)
         element_data = []
         for child in (child_data if is_array else [child_data]):
             value_type = loader_class
@@ -312,7 +416,10 @@ class EntryMeta(abc.ABCMeta):
             fields["FIELDS"] = {}
         fields["FIELDS"].update({k: v for k, v in fields.items() if isinstance(v, Field)})
         fields = {k: v for k, v in fields.items() if k not in fields["FIELDS"]}
-        fields["__slots__"] = tuple({*fields.get("__slots__", ()), *fields["FIELDS"].keys()})
+        inherited_slots = {slot for base in bases for klass in base.__mro__ for slot in getattr(klass, "__slots__", ())}
+        fields["__slots__"] = tuple(
+            k for k in dict.fromkeys([*fields.get("__slots__", ()), *fields["FIELDS"].keys()]) if k not in inherited_slots
+        )
         cls: type[Entry] = abc.ABCMeta.__new__(mcs, name, bases, fields, **kwargs)
         if json_use_parent is not None:
             cls.JSON_USE_PARENT = json_use_parent
@@ -322,6 +429,7 @@ class EntryMeta(abc.ABCMeta):
             cls.JSON_TYPE = json_type
         for k, v in cls.FIELDS.items():
             v.bind(k, cls)
+        cls.FIELD_LOADERS = tuple((v.dst_name, v.load) for v in cls.FIELDS.values())
         return cls
 
 TEntry = TypeVar("TEntry", bound="Entry")
@@ -332,6 +440,7 @@ class Entry(metaclass=EntryMeta):
     JSON_NO_AUTOLOAD = False
 
     FIELDS: ClassVar[dict[str, Field]]
+    FIELD_LOADERS: ClassVar[tuple[tuple[str, Callable[[Entry, ET.Element | dict, Entry | None, LoaderContext], Any]], ...]]
     TAG: ClassVar[str] = "[unspecified tag]"
     ALLOW_REMOTE: ClassVar[bool] = False
     JSON_USE_PARENT: ClassVar[bool] = False
@@ -350,8 +459,8 @@ class Entry(metaclass=EntryMeta):
         if isinstance(data, dict) and self.JSON_USE_PARENT:
             data = ctx.entry_data_map[parent]
         self.parent = parent
-        for field in self.FIELDS.values():
-            setattr(self, field.dst_name, field.load(self, data, parent, ctx))
+        for name, load in self.FIELD_LOADERS:
+            setattr(self, name, load(self, data, parent, ctx))
 
     @property
     def filename(self):
@@ -391,15 +500,17 @@ class RemoteEntry(Entry):
 
         if isinstance(data, ET.Element) and "source" in data.attrib:
             src = data.attrib["source"]
-            rsrc_path = os.path.join(os.path.dirname(ctx.path), src)
-            rsrc = ET.parse(rsrc_path).getroot()
-            for k, v in data.attrib.items():
-                rsrc.attrib[k] = v
+            rsrc_path = _source_path(ctx.path, src)
+            root = _parse_xml(rsrc_path, os.stat(rsrc_path).st_mtime_ns)
+            # the cached root is shared, so the merged attributes go on a new element holding the same children
+            rsrc = ET.Element(root.tag, {**root.attrib, **data.attrib})
             del rsrc.attrib["source"]
+            rsrc.text = root.text
+            rsrc.extend(root)
 
         elif isinstance(data, dict) and "source" in data:
             src = data["source"]
-            rsrc_path = os.path.join(os.path.dirname(ctx.path), src)
+            rsrc_path = _source_path(ctx.path, src)
             with iopen(rsrc_path, "r", encoding="utf-8") as f:
                 rsrc = json.loads(f.read())
             for k, v in data.items():
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import os
 from typing import cast, Any
 
 try:
@@ -157,32 +158,53 @@ class MapRenderer:
 class PygameLoader(tmx.BaseLoader):
     """Pygame-aware TMX loader"""
 
-    __slots__ = ("convert_alpha",)
+    __slots__ = ("convert_alpha", "_images", "_fonts")
 
     def __init__(self, convert_alpha: bool = True):
         self.convert_alpha = convert_alpha
+        self._images: dict[str, pygame.Surface] = {}
+        self._fonts: dict[tuple[str, float], ft.Font] = {}
 
     def load_image(self, path: str) -> pygame.Surface:
+        # Tilesets and image layers often share one image file, so each one is only loaded and converted once
+        path = os.path.normpath(path)
+        try:
+            return self._images[path]
+        except KeyError:
+            pass
         img = pygame.image.load(path)
         if self.convert_alpha:
-            return img.convert_alpha()
+            img = img.convert_alpha()
+        self._images[path] = img
         return img
 
     def load_font(self, family: str, size: float) -> ft.Font:
-        return ft.SysFont(family, cast(int, size))
+        try:
+            return self._fonts[family, size]
+        except KeyError:
+            pass
+        font = self._fonts[family, size] = ft.SysFont(family, cast(int, size))
+        return font
 
 @PygameLoader.register
 class Tile(tmx.Tile):
     """Extra Pygame-related functionality for the base Tile class"""
 
-    __slots__ = ()
+    __slots__ = ("_surface",)
+
+    _surface: pygame.Surface | None
 
     @property
     def surface(self) -> pygame.Surface | None:
-        """Fetches the Pygame graphic of the tile"""
-        if self.tileset is None:
-            return None
-        return self.tileset.img.surface.subsurface(self.rect)
+        """Fetches the Pygame graphic of the tile. The subsurface is created once, and shared by every user of
+        the tile"""
+        try:
+            return self._surface
+        except AttributeError:
+            pass
+        # tiles without a rect have no tileset, or come from an image collection tileset, whose per-tile images aren't loaded
+        self._surface = None if self.rect is None else self.tileset.img.surface.subsurface(self.rect)
+        return self._surface
 
 @PygameLoader.register
 class Map(tmx.Map):
@@ -219,8 +241,11 @@ class ObjectGroup(tmx.ObjectGroup):
         assert in_rect is not None
         rect = pygame.Rect(in_rect)
         for obj in sorted(self.objects, key=lambda obj: -obj.y):  # TODO: Don't sort literally everything every time this is called
-            if obj.has_tile and obj.tile.surface:
-                to.blit(obj.tile.surface, (obj.x - rect.x, obj.y - obj.tile.surface.get_height() - rect.y))
+            if not obj.has_tile:
+                continue
+            surface = obj.tile.surface  # fetched once, the Tile caches its subsurface
+            if surface:
+                to.blit(surface, (obj.x - rect.x, obj.y - surface.get_height() - rect.y))
         return to
 
 @PygameLoader.register
@@ -240,17 +265,20 @@ class TileLayer(tmx.TileLayer):
         if to is None:
             to = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
 
-        tilex1 = max(0, rect.x // self.map.tilewidth)
-        tiley1 = max(0, rect.y // self.map.tileheight)
-        tilex2 = min(self.width-1, int(math.ceil((rect.x + rect.w) / self.map.tilewidth)))
-        tiley2 = min(self.height-1, int(math.ceil((rect.y + rect.h) / self.map.tileheight)))
+        tiles = self.map.tiles
+        tilewidth, tileheight = self.map.tilewidth, self.map.tileheight
+        gids = self.data.data  # the raw array, indexed linearly to skip LayerData's (x, y) unpacking
+        tilex1 = max(0, rect.x // tilewidth)
+        tiley1 = max(0, rect.y // tileheight)
+        tilex2 = min(self.width-1, int(math.ceil((rect.x + rect.w) / tilewidth)))
+        tiley2 = min(self.height-1, int(math.ceil((rect.y + rect.h) / tileheight)))
         for y in range(tiley1, tiley2+1):
+            row = y * self.width
             for x in range(tilex1, tilex2+1):
                 # TODO: Implement tint
-                tile = self.map.tiles[self.data[x, y]]
-                if tile.surface:
-                    img = tile.surface
+                img = tiles[gids[row + x]].surface
+                if img:
                     # img = tile.surface.copy()
                     # img.set_alpha(self.opacity)
-                    to.blit(img, (x * self.map.tilewidth - rect.x, y * self.map.tileheight - rect.y))
+                    to.blit(img, (x * tilewidth - rect.x, y * tileheight - rect.y))
         return to
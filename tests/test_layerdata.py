@@ -0,0 +1,135 @@
+"""Tests for decoding the tile layer data formats Tiled writes"""
+
+import os
+import sys
+import gzip
+import json
+import zlib
+import base64
+import struct
+import tempfile
+import unittest
+import importlib
+
+# the repository root is the package itself
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_ROOT))
+tmxparse = importlib.import_module(os.path.basename(_ROOT))
+
+GIDS = [1, 2, 0, 4, 3, 0x80000001]  # the last one is horizontally flipped
+WIDTH, HEIGHT = 3, 2
+
+MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="{width}" height="{height}" tilewidth="16" tileheight="16" infinite="0">
+ <layer id="1" name="Tile Layer 1" width="{width}" height="{height}">
+  {data}
+ </layer>
+</map>
+"""
+
+def encode(gids, compression=None):
+    """Encodes GIDs the way Tiled does for base64 layer data"""
+    raw = struct.pack(f"<{len(gids)}I", *gids)
+    if compression == "zlib":
+        raw = zlib.compress(raw)
+    elif compression == "gzip":
+        raw = gzip.compress(raw)
+    return base64.b64encode(raw).decode("ascii")
+
+def load_layer(data, json_layer=None):
+    """Loads a map whose only layer holds the given <data> element (or, for JSON, layer dict), returning its LayerData"""
+    with tempfile.TemporaryDirectory() as tmp:
+        if json_layer is None:
+            path = os.path.join(tmp, "map.tmx")
+            contents = MAP.format(width=WIDTH, height=HEIGHT, data=data)
+        else:
+            path = os.path.join(tmp, "map.tmj")
+            contents = json.dumps({
+                "type": "map", "version": "1.10", "orientation": "orthogonal", "renderorder": "right-down",
+                "width": WIDTH, "height": HEIGHT, "tilewidth": 16, "tileheight": 16, "infinite": False,
+                "tilesets": [], "layers": [{
+                    "type": "tilelayer", "id": 1, "name": "Tile Layer 1", "x": 0, "y": 0,
+                    "width": WIDTH, "height": HEIGHT, "opacity": 1, "visible": True, **json_layer
+                }]
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(contents)
+        return tmxparse.BaseLoader().load(path).layers[0].data
+
+class XMLLayerDataTest(unittest.TestCase):
+    """Layer data in each of the encodings of the TMX format"""
+
+    def test_csv(self):
+        data = load_layer('<data encoding="csv">\n' + ",".join(map(str, GIDS)) + "\n</data>")
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64(self):
+        data = load_layer(f'<data encoding="base64">\n   {encode(GIDS)}\n  </data>')
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64_zlib(self):
+        data = load_layer(f'<data encoding="base64" compression="zlib">{encode(GIDS, "zlib")}</data>')
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64_gzip(self):
+        data = load_layer(f'<data encoding="base64" compression="gzip">{encode(GIDS, "gzip")}</data>')
+        self.assertEqual(list(data), GIDS)
+
+    def test_tile_elements(self):
+        tiles = "".join('<tile/>' if gid == 0 else f'<tile gid="{gid}"/>' for gid in GIDS)
+        data = load_layer(f"<data>{tiles}</data>")
+        self.assertEqual(list(data), GIDS)
+
+    def test_unsupported_compression(self):
+        data = load_layer(f'<data encoding="base64" compression="zstd">{encode(GIDS)}</data>')
+        with self.assertRaises(ValueError):
+            data.data  # pylint: disable=pointless-statement
+
+    def test_unsupported_encoding(self):
+        data = load_layer('<data encoding="hex">00</data>')
+        with self.assertRaises(ValueError):
+            data.data  # pylint: disable=pointless-statement
+
+    def test_empty_payload(self):
+        for element in ('<data encoding="csv"/>', '<data encoding="base64">\n  </data>', "<data/>"):
+            with self.subTest(element=element):
+                data = load_layer(element)
+                self.assertEqual(list(data.data), [])
+                self.assertEqual(len(data), 0)
+
+    def test_indexing(self):
+        data = load_layer(f'<data encoding="base64" compression="zlib">{encode(GIDS, "zlib")}</data>')
+        self.assertEqual(data[1, 1], GIDS[WIDTH + 1])
+        self.assertEqual(data[4], GIDS[4])
+        self.assertEqual(bytes(data.raw), struct.pack(f"={len(GIDS)}I", *GIDS))
+
+class JSONLayerDataTest(unittest.TestCase):
+    """Layer data in each of the encodings of the JSON format"""
+
+    def test_array(self):
+        data = load_layer(None, {"data": GIDS})
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64(self):
+        data = load_layer(None, {"encoding": "base64", "data": encode(GIDS)})
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64_zlib(self):
+        data = load_layer(None, {"encoding": "base64", "compression": "zlib", "data": encode(GIDS, "zlib")})
+        self.assertEqual(list(data), GIDS)
+
+    def test_base64_gzip(self):
+        data = load_layer(None, {"encoding": "base64", "compression": "gzip", "data": encode(GIDS, "gzip")})
+        self.assertEqual(list(data), GIDS)
+
+    def test_unsupported_compression(self):
+        data = load_layer(None, {"encoding": "base64", "compression": "zstd", "data": encode(GIDS)})
+        with self.assertRaises(ValueError):
+            data.data  # pylint: disable=pointless-statement
+
+    def test_empty_payload(self):
+        data = load_layer(None, {"encoding": "base64", "data": ""})
+        self.assertEqual(list(data), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Regression tests for loading external files referenced by a map"""
+
+import os
+import sys
+import tempfile
+import unittest
+import importlib
+
+# the repository root is the package itself
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_ROOT))
+tmxparse = importlib.import_module(os.path.basename(_ROOT))
+
+MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="1" height="1" tilewidth="16" tileheight="16" infinite="0">
+{tilesets}
+ <layer id="1" name="Tile Layer 1" width="1" height="1">
+  <data encoding="csv">0</data>
+ </layer>
+</map>
+"""
+
+TILESET = """<?xml version="1.0" encoding="UTF-8"?>
+<tileset version="1.10" name="present" tilewidth="16" tileheight="16" tilecount="4" columns="2">
+ <image source="present.png" width="32" height="32"/>
+</tileset>
+"""
+
+def load_map(sources):
+    """Loads a map referencing the given external tilesets, of which only present.tsx exists"""
+    tilesets = "\\n".join(f' <tileset firstgid="{1 + 4 * i}" source="{source}"/>' for i, source in enumerate(sources))
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "map.tmx"), "w", encoding="utf-8") as f:
+            f.write(MAP.format(tilesets=tilesets))
+        with open(os.path.join(tmp, "present.tsx"), "w", encoding="utf-8") as f:
+            f.write(TILESET)
+        return tmxparse.BaseLoader().load(os.path.join(tmp, "map.tmx"))
+
+class MissingTilesetTest(unittest.TestCase):
+    """A missing external tileset has to be reported as such, however many tilesets the map references"""
+
+    def test_one_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            load_map(["missing1.tsx"])
+
+    def test_all_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            load_map(["missing1.tsx", "missing2.tsx"])
+
+    def test_some_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            load_map(["present.tsx", "missing1.tsx", "missing2.tsx"])
+
+    def test_none_missing(self):
+        tmap = load_map(["present.tsx", "present.tsx"])
+        self.assertEqual([i.firstgid for i in tmap.tilesets], [1, 5])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Regression tests for the Tile class"""
+
+import os
+import sys
+import unittest
+import importlib
+
+# the repository root is the package itself
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_ROOT))
+tmxparse = importlib.import_module(os.path.basename(_ROOT))
+
+class TileConstructorTest(unittest.TestCase):
+    """Every documented form of Tile() has to produce a usable tile"""
+
+    def test_no_arguments(self):
+        tile = tmxparse.Tile()
+
+        self.assertEqual(tile.gid, 0)
+        self.assertIsNone(tile.rect)
+        self.assertIsNone(tile.properties)
+        self.assertEqual(hash(tile), hash(tmxparse.Tile()))
+        self.assertEqual(tile, tmxparse.Tile())
+
+    def test_empty_tile(self):
+        tile = tmxparse.Tile(None, 0)
+
+        self.assertEqual(tile.gid, 0)
+        self.assertIsNone(tile.rect)
+        self.assertEqual(tile, tmxparse.Tile())
+
+    def test_one_argument(self):
+        with self.assertRaises(ValueError):
+            tmxparse.Tile(tmxparse.Tileset())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for looking tiles up by GID through TileCollection"""
+
+import os
+import sys
+import tempfile
+import unittest
+import importlib
+
+# the repository root is the package itself
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_ROOT))
+tmxparse = importlib.import_module(os.path.basename(_ROOT))
+
+MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="4" height="2" tilewidth="16" tileheight="16" infinite="0">
+ <tileset firstgid="5" name="second" tilewidth="16" tileheight="16" tilecount="6" columns="3">
+  <image source="second.png" width="48" height="32"/>
+  <tile id="0">
+   <properties>
+    <property name="solid" type="bool" value="true"/>
+   </properties>
+  </tile>
+ </tileset>
+ <tileset firstgid="1" name="first" tilewidth="16" tileheight="16" tilecount="4" columns="2">
+  <image source="first.png" width="32" height="32"/>
+ </tileset>
+ <layer id="1" name="Tile Layer 1" width="4" height="2">
+  <data encoding="csv">1,4,5,10,0,5,4,0</data>
+ </layer>
+</map>
+"""
+
+FLIPPED_HORIZONTALLY = 0x80000000
+
+class SparseTileCollection(tmxparse.TileCollection):
+    """Caches every GID in a dict, as for maps with huge GID ranges"""
+    DENSE_LIMIT = 0
+
+class TileCollectionTest(unittest.TestCase):
+    """GID lookups, with both the list and the dict cache"""
+
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "map.tmx"), "w", encoding="utf-8") as f:
+                f.write(MAP)
+            cls.map = tmxparse.BaseLoader().load(os.path.join(tmp, "map.tmx"))
+
+    def collections(self):
+        for collection_cls in (tmxparse.TileCollection, SparseTileCollection):
+            with self.subTest(collection=collection_cls.__name__):
+                yield collection_cls(tmxparse.Tile, self.map.tilesets)
+
+    def test_tileset_boundaries(self):
+        first, second = sorted(self.map.tilesets, key=lambda i: i.firstgid)
+        for tiles in self.collections():
+            for gid, tileset, tileid in ((1, first, 0), (4, first, 3), (5, second, 0), (10, second, 5)):
+                tile = tiles[gid]
+                self.assertIs(tile.tileset, tileset)
+                self.assertEqual(tile.id, tileid)
+                self.assertEqual(tile.gid, gid)
+            self.assertEqual(tiles[5].properties, {"solid": "true"})
+            self.assertIsNone(tiles[4].properties)
+
+    def test_cached(self):
+        for tiles in self.collections():
+            self.assertIs(tiles[6], tiles[6])
+
+    def test_gid_zero(self):
+        for tiles in self.collections():
+            self.assertEqual(tiles[0].gid, 0)
+            self.assertIsNone(tiles[0].tileset)
+            self.assertIsNone(tiles[0].rect)
+            self.assertIs(tiles[0], tiles[0])
+
+    def test_out_of_range(self):
+        for tiles in self.collections():
+            with self.assertRaises(IndexError):
+                tiles[11]  # pylint: disable=pointless-statement
+
+    def test_negative(self):
+        for tiles in self.collections():
+            tiles[10]  # pylint: disable=pointless-statement
+            for gid in (-1, -10):
+                with self.assertRaises(IndexError):
+                    tiles[gid]  # pylint: disable=pointless-statement
+
+    def test_flipped(self):
+        # TileCollection doesn't decode flip flags; a flipped GID is not a valid index, rather than some other tile
+        for tiles in self.collections():
+            with self.assertRaises(IndexError):
+                tiles[FLIPPED_HORIZONTALLY | 5]  # pylint: disable=pointless-statement
+            with self.assertRaises(IndexError):
+                tiles.resolve_many([1, FLIPPED_HORIZONTALLY | 5])
+
+    def test_resolve_many(self):
+        gids = list(self.map.layers[0].data)
+        for tiles in self.collections():
+            resolved = tiles.resolve_many(gids)
+            self.assertEqual(len(resolved), len(gids))
+            for gid, tile in zip(gids, resolved):
+                self.assertIs(tile, tiles[gid])
+
+    def test_layer_iteration(self):
+        layer = self.map.layers[0]
+        self.assertEqual(
+            [(x, y, tile.gid) for x, y, tile in layer],
+            [(i % layer.width, i // layer.width, gid) for i, gid in enumerate(layer.data)]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
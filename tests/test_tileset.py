@@ -0,0 +1,121 @@
+"""Regression tests for tileset loading"""
+
+import os
+import sys
+import tempfile
+import unittest
+import importlib
+
+# the repository root is the package itself
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_ROOT))
+tmxparse = importlib.import_module(os.path.basename(_ROOT))
+
+MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="2" height="1" tilewidth="16" tileheight="16" infinite="0">
+ <tileset firstgid="1" source="external.tsx"/>
+ <layer id="1" name="Tile Layer 1" width="2" height="1">
+  <data encoding="csv">1,2</data>
+ </layer>
+</map>
+"""
+
+TILESET = """<?xml version="1.0" encoding="UTF-8"?>
+<tileset version="1.10" name="external" tilewidth="16" tileheight="16" tilecount="4" columns="2">
+ <image source="external.png" width="32" height="32"/>
+ <tile id="1">
+  <properties>
+   <property name="solid" type="bool" value="true"/>
+  </properties>
+ </tile>
+</tileset>
+"""
+
+IMAGE_COLLECTION_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="2" height="1" tilewidth="16" tileheight="16" infinite="0">
+ <tileset firstgid="1" name="collection" tilewidth="32" tileheight="32" tilecount="2" columns="0">
+  <grid orientation="orthogonal" width="1" height="1"/>
+  <tile id="0">
+   <image source="a.png" width="32" height="32"/>
+  </tile>
+  <tile id="1">
+   <image source="b.png" width="16" height="32"/>
+  </tile>
+ </tileset>
+ <layer id="1" name="Tile Layer 1" width="2" height="1">
+  <data encoding="csv">1,2</data>
+ </layer>
+</map>
+"""
+
+UNTYPED_PROPERTIES_MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" width="1" height="1" tilewidth="16" tileheight="16" infinite="0">
+ <tileset firstgid="1" name="inline" tilewidth="16" tileheight="16" tilecount="4" columns="2">
+  <image source="inline.png" width="32" height="32"/>
+  <tile id="0">
+   <properties>
+    <property name="kind" value="wall"/>
+    <property name="note">first line
+second line</property>
+    <property name="solid" type="bool" value="true"/>
+   </properties>
+  </tile>
+ </tileset>
+ <layer id="1" name="Tile Layer 1" width="1" height="1">
+  <data encoding="csv">1</data>
+ </layer>
+</map>
+"""
+
+def load_map(files, name="map.tmx"):
+    """Writes the given {filename: contents} to a temporary directory, and loads the named map from it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for filename, contents in files.items():
+            with open(os.path.join(tmp, filename), "w", encoding="utf-8") as f:
+                f.write(contents)
+        return tmxparse.BaseLoader().load(os.path.join(tmp, name))
+
+class ExternalTilesetTest(unittest.TestCase):
+    """Tiles defined in an external .tsx file have to survive the map's tileset reference being loaded"""
+
+    def test_tile_properties(self):
+        tmap = load_map({"map.tmx": MAP, "external.tsx": TILESET})
+
+        self.assertIn(1, tmap.tilesets[0].tiledata)
+        self.assertIsNotNone(tmap.tiles[2].properties)
+        self.assertEqual(tmap.tiles[2].properties["solid"], "true")
+        self.assertIsNone(tmap.tiles[1].properties)
+
+class TilePropertiesTest(unittest.TestCase):
+    """Tile properties as Tiled writes them, which leaves out some attributes"""
+
+    def test_defaults(self):
+        props = load_map({"map.tmx": UNTYPED_PROPERTIES_MAP}).tiles[1].properties
+
+        self.assertEqual(props["kind"], "wall")
+        self.assertEqual(props.types["kind"], "string")
+        self.assertEqual(props["note"], "first line\nsecond line")
+        self.assertEqual(props.types["note"], "string")
+        self.assertEqual(props.types["solid"], "bool")
+
+    def test_frozen(self):
+        tile = load_map({"map.tmx": UNTYPED_PROPERTIES_MAP}).tiles[1]
+
+        self.assertTrue(tile.properties.frozen)
+        self.assertEqual(hash(tile), hash(tile))
+        with self.assertRaises(ValueError):
+            tile.properties["kind"] = "floor"
+
+class ImageCollectionTilesetTest(unittest.TestCase):
+    """Tilesets with columns="0" have one image per tile, and no atlas to locate the tiles in"""
+
+    def test_load(self):
+        tmap = load_map({"map.tmx": IMAGE_COLLECTION_MAP})
+
+        self.assertEqual(tmap.tilesets[0].columns, 0)
+        self.assertEqual([tile.gid for _, _, tile in tmap.layers[0]], [1, 2])
+        self.assertIsNone(tmap.tiles[1].rect)
+        self.assertIsNone(tmap.tiles[2].rect)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 import os
+import sys
 import array
 import types
+import gzip
+import zlib
+import base64
 import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, product
 from collections import UserDict
 import xml.etree.ElementTree as ET
-from typing import Generator, Any, Union, get_origin, get_args, cast, TypeVar
+from typing import Generator, Sequence, Callable, Any, Union, get_origin, get_args, cast, TypeVar
 
 from .base import BaseLoader, SpecializableMixin, Entry, Field, CustomLoaderField, AliasField, ParsedField, LoaderContext, RemoteEntry
 
 T = TypeVar("T")
 
+_WS_DEL = str.maketrans("", "", " \n\r\t")
+
 def not_optional(x: T | None) -> T:
     assert x is not None, "must not be None"
     return x
@@ -21,21 +30,42 @@ def not_optional(x: T | None) -> T:
 class TileCollection:
     """A helper class that lets you fetch a tile by its GID"""
 
+    __slots__ = ("tile_cls", "tilesets", "_firstgids", "_cache")
+
+    # Up to this many GIDs, resolved tiles are cached in a flat list indexed by GID rather than a dict
+    DENSE_LIMIT = 1 << 20
+
     tile_cls: type[Tile]
     tilesets: list[Tileset]
 
     def __init__(self, tile_cls: type[Tile], tilesets: list[Tileset]):
         self.tile_cls = tile_cls
         self.tilesets = sorted(tilesets, key=lambda x: (x.firstgid))
+        self._firstgids = array.array("I", [i.firstgid for i in self.tilesets])
+        gid_count = max((i.firstgid + i.tilecount for i in self.tilesets), default=1)
+        self._cache: list[Tile | None] | dict[int, Tile] = [None] * gid_count if gid_count <= self.DENSE_LIMIT else {}
+        self._cache[0] = tile_cls(None, 0, None)
 
     def __getitem__(self, gid: int) -> Tile:
-        if gid == 0:
-            return self.tile_cls(None, 0, None)
-        tileset_idx = bisect.bisect_left(self.tilesets, gid, key=lambda x: (x.firstgid))
-        if len(self.tilesets) == tileset_idx or self.tilesets[tileset_idx].firstgid != gid:
-            tileset_idx -= 1
-        tileset = self.tilesets[tileset_idx]
-        return tileset[gid - (tileset.firstgid)]
+        if gid < 0:  # would index the dense cache from the end
+            raise IndexError(f"no tile with GID {gid}")
+        try:
+            tile = self._cache[gid]
+        except LookupError:
+            tile = None
+        if tile is not None:
+            return tile
+        tileset_idx = bisect.bisect_right(self._firstgids, gid) - 1
+        if tileset_idx < 0:
+            raise IndexError(f"no tile with GID {gid}")
+        tile = self._cache[gid] = self.tilesets[tileset_idx][gid - self._firstgids[tileset_idx]]
+        return tile
+
+    def resolve_many(self, gids: Sequence[int]) -> list[Tile]:
+        """Fetches the tiles for a whole sequence of GIDs (e.g. a LayerData) at once"""
+        for gid in set(gids):
+            self[gid]  # pylint: disable=pointless-statement
+        return list(map(self._cache.__getitem__, gids))
 
 @BaseLoader.register
 class Map(SpecializableMixin, RemoteEntry, tag="map", base=True, attrib="class"):
@@ -64,20 +94,26 @@ class Map(SpecializableMixin, RemoteEntry, tag="map", base=True, attrib="class")
     tilesets: list[Tileset] | Any = ParsedField(xml_child=True)
     layers: list[LayerBase] | Any = ParsedField(xml_child=True)
 
-    imgs: list[Image] | Any = CustomLoaderField(lambda obj, _data, _parent, _ctx: (
-        [i.img for i in obj.tilesets if i.img is not None] +
-        [i.img for i in obj.layers if isinstance(i, ImageLayer)]
-    ))
+    imgs: list[Image] | Any = CustomLoaderField(lambda obj, _data, _parent, _ctx: list(chain(
+        (i.img for i in obj.tilesets if i.img is not None),
+        (i.img for i in obj.layers if isinstance(i, ImageLayer))
+    )))
     tiles: TileCollection | Any = CustomLoaderField(lambda obj, _data, _parent, ctx: TileCollection(ctx.loader.PARSERS["tile"], obj.tilesets))
 
     def __repr__(self):
         return f"<Map {os.path.basename(self.source)!r} {self.width}x{self.height}>"
 
+    def preload_images(self, max_workers: int | None = None) -> None:
+        """Loads the surfaces of every image in the map up front (see Image.surface), overlapping the loads
+        on a thread pool. The loader's load_image must be safe to call from multiple threads"""
+        with ThreadPoolExecutor(max_workers) as pool:
+            list(pool.map(lambda img: img.surface, [i for i in self.imgs if i is not None]))
+
 @BaseLoader.register
 class Tileset(RemoteEntry, tag="tileset"):
     """A TMX tileset"""
 
-    __slots__ = ("tiledata",)
+    __slots__ = ("tiledata", "_tile_cache")
 
     tile_cls: type[Tile] | Any = CustomLoaderField(lambda _obj, _data, _parent, ctx: ctx.loader.PARSERS["tile"])
 
@@ -89,19 +125,28 @@ class Tileset(RemoteEntry, tag="tileset"):
     img: Image | None | Any = ParsedField(xml_child=True, rename_from="image")
 
     tiledata: dict[int, Tile]
+    _tile_cache: dict[int, Tile]  # tiledata, plus every property-less tile handed out so far
 
     map: Map | Any = AliasField("parent")
 
     @classmethod
     def _load(cls, data: Any, parent: Entry | None, ctx: LoaderContext) -> Tileset:
         self: Tileset = super()._load(data, parent, ctx)
+        if "source" in (data.attrib if isinstance(data, ET.Element) else data):
+            # an external tileset; its tiles were already set up by the nested _load on the source's contents
+            return self
         if isinstance(data, ET.Element):
-            tiles = [i for i in data if isinstance(i, Tile)]
-            self.tiledata = {not_optional((i.id)): i for i in tiles}
+            tile_cls = self.tile_cls
+            self.tiledata = {tile.id: tile for tile in (ctx.load(tile_cls, i, self) for i in data if i.tag == "tile")}
         else:
             self.tiledata = {int(k): ctx.load(ctx.loader.PARSERS["tile"], v, self) for k, v in data.get("tiles", {}).items()}
             for tileid, tile in self.tiledata.items():
                 tile.id = tileid
+        for tile in self.tiledata.values():
+            tile._locate()  # pylint: disable=protected-access
+            if tile.properties is not None:  # tiles are shared between every place they're used, and must be hashable
+                tile.properties.freeze()
+        self._tile_cache = self.tiledata.copy()
         return self
 
     def __repr__(self):
@@ -113,9 +158,10 @@ class Tileset(RemoteEntry, tag="tileset"):
     def __getitem__(self, tileid: int) -> Tile:
         if tileid < 0 or tileid >= (self.tilecount):
             raise IndexError(f"no tile #{tileid}")
-        if tileid in self.tiledata:
-            return self.tiledata[tileid]
-        return (self.tile_cls)(self, tileid, None)  # pylint: disable=not-callable
+        tile = self._tile_cache.get(tileid)
+        if tile is None:
+            tile = self._tile_cache[tileid] = (self.tile_cls)(self, tileid, None)  # pylint: disable=not-callable
+        return tile
 
 @BaseLoader.register
 class Grid(Entry, tag="grid"):
@@ -126,11 +172,29 @@ class Grid(Entry, tag="grid"):
 @BaseLoader.register
 class Image(Entry, tag="image", json_use_parent=True):
     """A TMX image element"""
+
+    __slots__ = ("_surface",)
+
     width: int | None | Any = ParsedField(json_rename_from="imagewidth")
     height: int | None | Any = ParsedField(json_rename_from="imageheight")
     source: str | None | Any = ParsedField(json_rename_from="image")
-    surface: Any | Any = CustomLoaderField(lambda obj, data, parent, ctx: ctx.loader.load_image(
-        os.path.join(os.path.dirname(obj.filename), obj.source)))
+    _load_surface: Callable[[], Any] | Any = CustomLoaderField(lambda obj, data, parent, ctx: functools.partial(
+        ctx.loader.load_image, os.path.join(ctx.root_dir, obj.source)))
+
+    _surface: Any
+
+    @property
+    def surface(self) -> Any:
+        """The image, as returned by the loader's load_image. Loaded on first access"""
+        try:
+            return self._surface
+        except AttributeError:
+            self._surface = self._load_surface()
+            return self._surface
+
+    @surface.setter
+    def surface(self, value: Any) -> None:
+        self._surface = value
 
     def __repr__(self):
         return f"<Image {os.path.basename(self.source)!r} ({self.width}x{self.height})>"
@@ -139,21 +203,45 @@ class Image(Entry, tag="image", json_use_parent=True):
 class Text(Entry, tag="text"):
     """A TMX text element"""
 
+    __slots__ = ("_font",)
+
     fontfamily: str | Any = ParsedField()
     pixelsize: int | Any = ParsedField()
     wrap: bool | Any = ParsedField()
     text: str | Any = ParsedField(xml_text=True)
     color: str | Any = ParsedField(default="#ffffff")
 
-    font: Any | Any = CustomLoaderField(lambda obj, data, parent, ctx: ctx.loader.load_font(obj.fontfamily, obj.pixelsize))
+    _load_font: Callable[[], Any] | Any = CustomLoaderField(lambda obj, data, parent, ctx: functools.partial(
+        ctx.loader.load_font, obj.fontfamily, obj.pixelsize))
+
+    _font: Any
+
+    @property
+    def font(self) -> Any:
+        """The font, as returned by the loader's load_font. Loaded on first access"""
+        try:
+            return self._font
+        except AttributeError:
+            self._font = self._load_font()
+            return self._font
+
+    @font.setter
+    def font(self, value: Any) -> None:
+        self._font = value
 
 @BaseLoader.register
 class Tile(Entry, tag="tile"):  # , xml_child_ignore=["objectgroup"]):
     # TODO: Add back immutability. Turns out a custom __setattr__ was not very fast
     """Information about a tile"""
+
+    __slots__ = ("gid", "rect", "_hash")
+
     tileset: Tileset | None | Any = AliasField("parent")
     id: int | None | Any = ParsedField()  # Not optional, but loading from JSON will sometimes load this late
-    properties: Properties | None | Any = ParsedField(xml_child=True)
+    properties: Properties | None | Any = ParsedField(xml_child=True)  # frozen once loaded, as tiles are shared and hashable
+
+    gid: int  # The GID of the tile
+    rect: tuple[int, int, int, int] | None  # (x, y, w, h) location information for the tile within its tileset, if it has one
 
     def __repr__(self):
         props = "" if self.properties is None else f" (properties {self.properties})"
@@ -163,48 +251,76 @@ class Tile(Entry, tag="tile"):  # , xml_child_ignore=["objectgroup"]):
                  properties: Properties | None = None) -> None:
         if id_ is None:
             if tileset is None:
+                # a blank tile, to be filled in by the loader; until then it's equivalent to the empty tile
+                self.id = self.properties = self.rect = self._hash = None
+                self.gid = 0
                 return
             raise ValueError("__init__ takes 0, 2, or 3 arguments, 1 given")
         self.parent = self.tileset = tileset
         self.properties = properties
         self.id = id_
+        self._locate()
+
+    def _locate(self) -> None:
+        """Precomputes gid and rect, once both the tileset and the ID of this tile are known"""
+        tileset = self.tileset
+        self._hash = None
+        if tileset is None:
+            self.gid = 0
+            self.rect = None
+            return
+        id_ = not_optional(self.id)
+        self.gid = tileset.firstgid + id_
+        if not tileset.columns:
+            # image collection tilesets (columns="0") have one image per tile, rather than a shared atlas
+            self.rect = None
+            return
+        self.rect = (
+            (id_ % tileset.columns) * tileset.tilewidth, (id_ // tileset.columns) * tileset.tileheight,
+            tileset.tilewidth, tileset.tileheight
+        )
 
     def __hash__(self) -> int:
-        return hash(tuple((self.gid, self.properties)))
+        # Computed on first use rather than in _locate, as properties can only be hashed once frozen
+        if self._hash is None:
+            self._hash = self.gid if self.properties is None else hash((self.gid, self.properties))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Tile):
             return NotImplemented
-        return self.gid == other.gid and self.properties == other.properties
+        if self.gid != other.gid:
+            return False
+        if self.properties is None:
+            return other.properties is None
+        return self.properties == other.properties
 
-    @property
-    def rect(self) -> tuple[int, int, int, int] | None:
-        """Returns (x, y, w, h) location information for the tile within its tileset"""
-        if self.tileset is None:
-            return None
-        offsx = (not_optional(self.id) % self.tileset.columns) * self.tileset.tilewidth
-        offsy = (not_optional(self.id) // self.tileset.columns) * self.tileset.tileheight
-        return (offsx, offsy, self.tileset.tilewidth, self.tileset.tileheight)
+class _FrozenProperties:
+    """Mixin that Properties.freeze swaps into the class of a Properties object"""
 
-    @property
-    def gid(self) -> int:
-        """Returns the GID of the tile"""
-        if self.tileset is None:
-            return 0
-        return self.tileset.firstgid + not_optional(self.id)
+    __slots__ = ()
+
+    _hash: int
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def _refuse(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise ValueError("frozen object")
+
+    __setitem__ = __delitem__ = __ior__ = pop = popitem = setdefault = update = clear = _refuse
+
+_FROZEN_PROPERTIES_TYPES: dict[type[Properties], type[Properties]] = {}
 
 @BaseLoader.register
 class Properties(Entry, UserDict, tag="properties", json_use_parent=True):
     """Properties dictionary for a TMX element"""
 
-    __slots__ = ("frozen", "data", "types")
-
-    frozen: bool
+    __slots__ = ("data", "types", "_hash")
 
     def __init__(self, data=None, types=None):
         Entry.__init__(self)
         UserDict.__init__(self)
-        self.frozen = False
         self.types = {}
         if data is not None:
             self.update(data)
@@ -213,47 +329,57 @@ class Properties(Entry, UserDict, tag="properties", json_use_parent=True):
     @classmethod
     def _load(cls, data: Any, parent: Entry | None, ctx: LoaderContext) -> Properties:
         self = cls()
+        # the dict backing the UserDict is written to directly, a freshly created object can't be frozen
+        # names and types come from a tiny vocabulary, so they're interned to share one string across all Properties
+        values, types = self.data, self.types
         if isinstance(data, ET.Element):
             for i in data:
                 # TODO: text properties
-                self.types[i.attrib["name"]] = i.attrib["type"]
-                self[i.attrib["name"]] = i.attrib["value"]
+                # Tiled leaves out the type of string properties, and the value attribute of multiline ones
+                name = sys.intern(i.attrib["name"])
+                types[name] = sys.intern(i.attrib.get("type", "string"))
+                values[name] = i.attrib["value"] if "value" in i.attrib else i.text or ""
         elif "properties" in data:
             for key in data["properties"].keys():
                 # TODO: fix all of this
                 prop = ctx.loader.PARSERS["property"]()
-                prop.name = key
+                prop.name = sys.intern(key)
                 prop._value1 = data["properties"][key]
-                prop.type = data["propertytypes"][key]
+                prop.type = sys.intern(data["propertytypes"][key])
                 prop.value = cast(CustomLoaderField, Property.FIELDS["value"]).loader(prop, data, parent, ctx)
-                self.types[prop.name] = prop.type
-                self[prop.name] = prop.value
+                types[prop.name] = prop.type
+                values[prop.name] = prop.value
         return self
 
-    def __hash__(self) -> int:
-        if not self.frozen:
-            raise ValueError("cannot hash unfrozen Properties")
-        return hash(tuple(self.items()))
-
-    def __setitem__(self, key: Any, value: Any) -> None:
-        if self.frozen:
-            raise ValueError("frozen object")
-        return super().__setitem__(key, value)
-
-    def pop(self, key: Any, default: Any = None) -> Any:
-        if self.frozen:
+    @property
+    def frozen(self) -> bool:
+        """Whether this Properties object is immutable. Setting it to True is the same as calling freeze();
+        a frozen object can't be unfrozen"""
+        return isinstance(self, _FrozenProperties)
+
+    @frozen.setter
+    def frozen(self, value: bool) -> None:
+        if value:
+            self.freeze()
+        elif self.frozen:
             raise ValueError("frozen object")
-        return super().pop(key, default)
 
-    def update(self, *args: Any, **kwargs: Any) -> None:
+    def freeze(self) -> None:
+        """Makes this Properties object immutable (and thus hashable)"""
+        # instead of checking a flag on every write, the object moves to a subclass whose mutators all raise
         if self.frozen:
-            raise ValueError("frozen object")
-        return super().update(*args, **kwargs)
+            return
+        cls = type(self)
+        frozen_cls = _FROZEN_PROPERTIES_TYPES.get(cls)
+        if frozen_cls is None:
+            frozen_cls = _FROZEN_PROPERTIES_TYPES[cls] = cast(
+                "type[Properties]", type(f"Frozen{cls.__name__}", (_FrozenProperties, cls), {"__slots__": (), "__module__": cls.__module__})
+            )
+        self._hash = hash(frozenset(self.data.items()))
+        self.__class__ = frozen_cls
 
-    def clear(self) -> None:
-        if self.frozen:
-            raise ValueError("frozen object")
-        return super().clear()
+    def __hash__(self) -> int:
+        raise ValueError("cannot hash unfrozen Properties")
 
 def coerce(annotation, value):
     """turn xml attrib to Python object"""
@@ -277,6 +403,11 @@ def coerce(annotation, value):
         return annotation.lower() == "true" or (annotation.lower() != "false" and bool(int(value)))
     return annotation(value)
 
+_PROPERTY_TYPES: dict[str, Callable[[str], Any]] = {
+    "bool": (lambda x: False if x.lower() == "false" else bool(x)), "string": str, "int": int, "float": float,
+    "number": float
+}
+
 @BaseLoader.register
 class Property(Entry, tag="property"):
     # pylint: disable=protected-access
@@ -286,9 +417,8 @@ class Property(Entry, tag="property"):
     type: str | None | Any = ParsedField()
     _value1: str | None | Any = ParsedField(rename_from="value")
     _value2: str | None | Any = ParsedField(xml_text=True)
-    value: str | int | float | bool | Any = CustomLoaderField(lambda obj, _data, _parent, _ctx: coerce({
-        "bool": (lambda x: False if x.lower() == "false" else bool(x)), "string": str, "int": int, "number": float
-    }.get(obj.type, str), obj._value1 if obj._value1 is not None else obj._value2))
+    value: str | int | float | bool | Any = CustomLoaderField(lambda obj, _data, _parent, _ctx: _PROPERTY_TYPES.get(obj.type, str)(
+        obj._value1 if obj._value1 is not None else obj._value2))
 
     def __repr__(self):
         return f"<Property {self.name}={self.value!r}>"
@@ -325,14 +455,17 @@ class TileLayer(LayerBase, tag="layer", json_type="tilelayer"):
         if asdf.data is not None:
             asdf.data.width = cast(int, asdf.width)
             asdf.data.height = cast(int, asdf.height)
+            if isinstance(data, dict):
+                asdf.data._compression = data.get("compression") or None  # pylint: disable=protected-access
         return asdf
 
     def __repr__(self):
         return f"<Layer {self.width}x{self.height}>"
 
     def __iter__(self) -> Generator[tuple[int, int, Tile], None, None]:
-        for i, gid in enumerate(not_optional((self.data))):
-            yield (i % self.width, i // self.width, self.map.tiles[gid])  # pylint: disable=no-member
+        tiles = self.map.tiles.resolve_many(not_optional(self.data))  # pylint: disable=no-member
+        for (y, x), tile in zip(product(range(self.height), range(self.width)), tiles, strict=True):
+            yield (x, y, tile)
 
 @BaseLoader.register
 class ImageLayer(SpecializableMixin, LayerBase, tag="imagelayer", base=True, attrib="class", json_type="imagelayer"):
@@ -413,22 +546,28 @@ class Object(SpecializableMixin, Entry, tag="object", attrib="type"):
         """Returns the tile associated with this object, if present."""
         if self.gid is None:
             raise TypeError("not a tile object")
-        return cast(Tileset, self.parent).map.tiles[self.gid]
+        return cast(ObjectGroup, self.parent).map.tiles[self.gid]
 
 @BaseLoader.register
 class LayerData(Entry, tag="data"):
-    """A list of GIDs that represent the contents of a TileLayer. Supports indexing by (x,y) pair"""
+    """A list of GIDs that represent the contents of a TileLayer. Supports indexing by (x,y) pair or by
+    linear index"""
 
-    __slots__ = ("width", "height", "data")
+    __slots__ = ("width", "height", "data", "_text", "_encoding", "_compression")
 
     width: int | None
     height: int | None
+    data: array.array
+    _text: str | None  # encoded text that hasn't been decoded into data yet
+    _encoding: str | None  # "csv" or "base64"
+    _compression: str | None  # None, "zlib" or "gzip" (base64 only)
 
     def __init__(self, data: list[int] | None = None, width: int | None = None,
                  height: int | None = None):
         super().__init__()
         self.width = width
         self.height = height
+        self._text = self._encoding = self._compression = None
         if data is None:
             if self.width is None or self.height is None:
                 self.data = array.array("I")
@@ -437,7 +576,7 @@ class LayerData(Entry, tag="data"):
         else:
             self.data = array.array("I", data)
 
-    # TODO: Types beyond csv
+    # TODO: Chunked data of infinite maps
 
     @classmethod
     def _load(cls, data: Any, parent: Entry | None, ctx: LoaderContext) -> LayerData:
@@ -445,21 +584,69 @@ class LayerData(Entry, tag="data"):
         # pylint: disable=no-member
         if isinstance(data, list):
             self.data.extend(data)
+        elif isinstance(data, ET.Element) and "encoding" not in data.attrib:
+            # (deprecated) one <tile> element per GID
+            self.data.extend(int(i.attrib.get("gid", 0)) for i in data if i.tag == "tile")
         else:
-            self.data.extend(
-                int(i.strip())
-                for i in data.text.strip().replace("\n", "").split(",")
-                if i is not None
-            )
+            text = data if isinstance(data, str) else data.text
+            if not text or text.isspace():
+                return self  # an empty payload holds no GIDs, the data array is left empty
+            # Decoding is deferred until the GIDs are first accessed, see __getattr__
+            self._text = text
+            if isinstance(data, str):
+                # base64 JSON data; the compression is stored on the layer, which fills it in (see TileLayer._load)
+                self._encoding = "base64"
+            else:
+                self._encoding = data.attrib["encoding"]
+                self._compression = data.attrib.get("compression")
+            del self.data
         return self
 
+    def __getattr__(self, name: str) -> Any:
+        if name != "data" or self._text is None:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        if self._encoding == "csv":
+            self.data = array.array("I", map(int, self._text.translate(_WS_DEL).split(",")))
+        elif self._encoding == "base64":
+            self.data = self._decode_base64(self._text, self._compression)
+        else:
+            raise ValueError(f"unsupported layer data encoding {self._encoding!r}")
+        self._text = None
+        return self.data
+
+    @staticmethod
+    def _decode_base64(text: str, compression: str | None) -> array.array:
+        raw = base64.b64decode(text)  # whitespace around the payload is discarded
+        if compression == "zlib":
+            raw = zlib.decompress(raw)
+        elif compression == "gzip":
+            raw = gzip.decompress(raw)
+        elif compression:
+            raise ValueError(f"unsupported layer data compression {compression!r}")
+        gids = array.array("I")
+        gids.frombytes(raw)
+        if sys.byteorder == "big":  # GIDs are stored as little-endian uint32s
+            gids.byteswap()
+        return gids
+
+    @property
+    def raw(self) -> memoryview:
+        """Returns a zero-copy view of the underlying uint32 GID buffer, for handing the layer to C-level
+        renderers. Keeping the view alive prevents the data from being resized"""
+        return memoryview(self.data)
+
     def __setitem__(self, idx: tuple[int, int], _value: int) -> None:
         self.data[idx[1] * not_optional(self.width) + idx[0]] = _value
 
     def __iter__(self):
         return iter(self.data)
 
-    def __getitem__(self, idx: tuple[int, int]) -> int:
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, idx: tuple[int, int] | int) -> int:
+        if isinstance(idx, int):
+            return self.data[idx]
         try:
             return self.data[idx[1] * not_optional(self.width) + idx[0]]
         except (TypeError, IndexError):